@@ -1,22 +1,44 @@
-from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks, Header
+from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks, Header, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
 import os
+import functools
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import uuid
+import asyncio
+from collections import Counter
+from itertools import islice
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import aiohttp
 import json
+import hmac
+import subprocess
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import base64
+import jinja2
+import numpy as np
 import boto3
 from botocore.exceptions import ClientError, BotoCoreError
+
+try:
+    from arq import create_pool
+    from arq.connections import RedisSettings
+except ImportError:  # queue is optional; BackgroundTasks remains the fallback
+    create_pool = None
 # Load Velora CLI config (to read docker username)
 
 
@@ -26,27 +48,140 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=100,
+    minPoolSize=10,
+    serverSelectionTimeoutMS=3000,
+    retryWrites=True,
+    compressors="zstd,snappy"
+)
 db_name = os.environ.get('DB_NAME', 'velora')
 main_db = client[db_name]
 db = main_db  # Keep backward compatibility
 
+class TenantCollection:
+    """Scope every operation on a shared collection to one tenant.
+
+    All tenants live in the same physical collection with a `tenant` field, so
+    one set of RAM-resident indexes serves every tenant instead of a duplicated
+    index quadruplet per user hash. The wrapper injects the tenant key into
+    filters, inserted documents and aggregation pipelines, so handler code can
+    keep using the plain collection API.
+    """
+    __slots__ = ('_coll', '_tenant')
+
+    def __init__(self, coll, tenant: str):
+        self._coll = coll
+        self._tenant = tenant
+
+    def _scoped(self, query=None):
+        scoped = {"tenant": self._tenant}
+        if query:
+            scoped.update(query)
+        return scoped
+
+    def find(self, query=None, *args, **kwargs):
+        return self._coll.find(self._scoped(query), *args, **kwargs)
+
+    def find_one(self, query=None, *args, **kwargs):
+        return self._coll.find_one(self._scoped(query), *args, **kwargs)
+
+    def find_one_and_update(self, query, update, **kwargs):
+        return self._coll.find_one_and_update(self._scoped(query), update, **kwargs)
+
+    def insert_one(self, document, **kwargs):
+        return self._coll.insert_one({**document, "tenant": self._tenant}, **kwargs)
+
+    def update_one(self, query, update, **kwargs):
+        return self._coll.update_one(self._scoped(query), update, **kwargs)
+
+    def delete_one(self, query, **kwargs):
+        return self._coll.delete_one(self._scoped(query), **kwargs)
+
+    def delete_many(self, query, **kwargs):
+        return self._coll.delete_many(self._scoped(query), **kwargs)
+
+    def aggregate(self, pipeline, **kwargs):
+        return self._coll.aggregate([{"$match": {"tenant": self._tenant}}] + list(pipeline), **kwargs)
+
+    def count_documents(self, query=None, **kwargs):
+        return self._coll.count_documents(self._scoped(query), **kwargs)
+
+async def _ensure_indexes():
+    """Create the shared tenant-compound indexes backing the hot predicates"""
+    try:
+        await main_db.services.create_index([("tenant", 1), ("id", 1)], unique=True)
+        await main_db.services.create_index([("tenant", 1), ("developer_id", 1)])
+        await main_db.developers.create_index([("tenant", 1), ("id", 1)], unique=True)
+        await main_db.pipelines.create_index([("tenant", 1), ("id", 1)], unique=True)
+        await main_db.pipelines.create_index([("tenant", 1), ("service_id", 1), ("created_at", -1)])
+        await main_db.templates.create_index([("tenant", 1), ("service_type", 1)])
+        # Range-based pagination sorts on (created_at desc, id asc) within a tenant
+        await main_db.services.create_index([("tenant", 1), ("created_at", -1), ("id", 1)])
+        await main_db.developers.create_index([("tenant", 1), ("created_at", -1), ("id", 1)])
+        await main_db.templates.create_index([("tenant", 1), ("created_at", -1), ("id", 1)])
+        # Covered indexes for the webhook's narrow id lookups (no tenant in filter)
+        await main_db.services.create_index([("id", 1), ("name", 1), ("developer_id", 1), ("current_pipeline_id", 1)])
+        await main_db.developers.create_index([("id", 1), ("email", 1)])
+        await main_db.pipelines.create_index([("id", 1)])
+    except Exception as e:
+        logging.warning(f"Index creation failed: {str(e)}")
+
+_LEGACY_COLLECTION_KINDS = ('services', 'developers', 'pipelines', 'templates')
+
+async def _migrate_legacy_tenant_collections():
+    """One-time copy of per-tenant `{hash}_<kind>` collections into the shared ones.
+
+    Earlier releases gave every user hash its own collection quadruplet. Copy
+    each legacy document into the shared collection with its `tenant` field
+    set, then rename the source out of the way so the copy never reruns and
+    the original data stays recoverable.
+    """
+    for name in await main_db.list_collection_names():
+        tenant, _, kind = name.rpartition('_')
+        if not tenant or kind not in _LEGACY_COLLECTION_KINDS:
+            continue
+        try:
+            docs = [
+                {**doc, "tenant": tenant}
+                async for doc in main_db[name].find({}, projection={"_id": 0})
+            ]
+            if docs:
+                try:
+                    await main_db[kind].insert_many(docs, ordered=False)
+                except BulkWriteError:
+                    # Duplicates from a partially completed earlier run
+                    logging.info(f"Some documents from {name} were already migrated")
+            await main_db[name].rename(f"{name}_migrated")
+            logging.info(f"Migrated {len(docs)} documents from {name} into {kind}")
+        except Exception as e:
+            logging.warning(f"Migration of legacy collection {name} failed: {str(e)}")
+
+@functools.lru_cache(maxsize=4096)
+def _user_collections(user_hash: str):
+    """Build (once per tenant) the tenant-scoped collection wrappers"""
+    return {
+        'services': TenantCollection(main_db.services, user_hash),
+        'developers': TenantCollection(main_db.developers, user_hash),
+        'pipelines': TenantCollection(main_db.pipelines, user_hash),
+        'templates': TenantCollection(main_db.templates, user_hash)
+    }
+
 # Multi-Tenancy Helper Function
 def get_user_db(user_hash: str):
     """Get user-specific database collections for multi-tenancy"""
     if not user_hash:
         raise HTTPException(status_code=401, detail="User hash required. Run 'velora config setup' first.")
-    
-    # Use prefix-based collection names for user isolation
-    return {
-        'services': main_db[f"{user_hash}_services"],
-        'developers': main_db[f"{user_hash}_developers"],
-        'pipelines': main_db[f"{user_hash}_pipelines"],
-        'templates': main_db[f"{user_hash}_templates"]
-    }
+
+    return _user_collections(user_hash)
 
 # Create the main app
-app = FastAPI(title="Velora IDP API", description="Cloud-Native Internal Developer Platform")
+app = FastAPI(
+    title="Velora IDP API",
+    description="Cloud-Native Internal Developer Platform",
+    default_response_class=ORJSONResponse
+)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -113,33 +248,31 @@ class ServiceTemplate(BaseModel):
 
 # Helper Functions
 async def create_github_repo(repo_name: str, description: str, github_token: str) -> Dict[str, Any]:
-    """Create a GitHub repository with SSL fix"""
+    """Create a GitHub repository using the shared HTTP session"""
     try:
         headers = {
             'Authorization': f'token {github_token}',
             'Accept': 'application/vnd.github.v3+json',
             'Content-Type': 'application/json'
         }
-        
+
         data = {
             'name': repo_name,
             'description': description,
             'private': False,
             'auto_init': True
         }
-        
-        # SSL FIX: Use connector with verify_ssl=True explicitly
-        connector = aiohttp.TCPConnector(ssl=aiohttp.TCPConnector(verify_ssl=True))
-        timeout = aiohttp.ClientTimeout(total=30)
-        
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-            async with session.post('https://api.github.com/user/repos', 
-                                  headers=headers, json=data) as response:
-                if response.status == 201:
-                    return await response.json()
-                else:
-                    error_text = await response.text()
-                    raise HTTPException(status_code=400, detail=f"GitHub API error {response.status}: {error_text}")
+
+        # Reuse the pooled session created at startup (keep-alive, shared DNS cache)
+        session = app.state.http
+
+        async with session.post('https://api.github.com/user/repos',
+                                headers=headers, json=data) as response:
+            if response.status == 201:
+                return await response.json()
+            else:
+                error_text = await response.text()
+                raise HTTPException(status_code=400, detail=f"GitHub API error {response.status}: {error_text}")
     except aiohttp.ClientSSLError as ssl_error:
         logging.error(f"SSL Error with GitHub API: {str(ssl_error)}")
         raise HTTPException(status_code=500, detail="SSL certificate verification failed. Check network/proxy settings.")
@@ -153,36 +286,94 @@ async def push_template_to_repo(repo_url: str, template_files: Dict[str, str], g
     # For now, we'll simulate this
     logging.info(f"Pushing template files to {repo_url}")
 
+# Compiled once at import; autoescape guards against markup in service fields
+DEPLOYMENT_EMAIL_TEMPLATE = jinja2.Template("""
+<h2>Deployment Notification</h2>
+<p><strong>Service:</strong> {{ service_name }}</p>
+<p><strong>Status:</strong> {{ status }}</p>
+<p><strong>Build Number:</strong> {{ build_number }}</p>
+{% if service_url %}<p><strong>Service URL:</strong> <a href="{{ service_url }}">{{ service_url }}</a></p>{% endif %}
+<p><strong>Timestamp:</strong> {{ timestamp }}</p>
+
+<p>Visit your <a href="{{ frontend_url }}">Velora Dashboard</a> for more details.</p>
+""", autoescape=True)
+
+# Persistent SMTP connection shared by all sends (amortizes STARTTLS + LOGIN)
+_smtp_conn = None
+_smtp_lock = threading.Lock()
+
+def _smtp_connect():
+    smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
+    smtp_port = int(os.getenv('SMTP_PORT', '587'))
+    smtp_username = os.getenv('SMTP_USERNAME')
+    smtp_password = os.getenv('SMTP_PASSWORD')
+
+    server = smtplib.SMTP(smtp_server, smtp_port)
+    server.starttls()
+    server.login(smtp_username, smtp_password)
+    return server
+
+def _smtp_send_blocking(to_email: str, subject: str, body: str):
+    """Blocking SMTP send over the cached connection; runs in a worker thread"""
+    global _smtp_conn
+    smtp_username = os.getenv('SMTP_USERNAME')
+    smtp_password = os.getenv('SMTP_PASSWORD')
+
+    if not all([smtp_username, smtp_password]):
+        logging.warning("SMTP credentials not configured")
+        return
+
+    msg = MIMEMultipart()
+    msg['From'] = smtp_username
+    msg['To'] = to_email
+    msg['Subject'] = subject
+
+    msg.attach(MIMEText(body, 'html'))
+    text = msg.as_string()
+
+    with _smtp_lock:
+        try:
+            if _smtp_conn is None:
+                _smtp_conn = _smtp_connect()
+            _smtp_conn.sendmail(smtp_username, to_email, text)
+        except (smtplib.SMTPException, OSError):
+            # Stale or dropped connection; reconnect once and retry
+            _smtp_conn = _smtp_connect()
+            _smtp_conn.sendmail(smtp_username, to_email, text)
+
+    logging.info(f"Email sent to {to_email}")
+
 async def send_email_notification(to_email: str, subject: str, body: str):
-    """Send email notification via Gmail SMTP"""
+    """Send email notification via Gmail SMTP without blocking the event loop"""
     try:
-        smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-        smtp_port = int(os.getenv('SMTP_PORT', '587'))
-        smtp_username = os.getenv('SMTP_USERNAME')
-        smtp_password = os.getenv('SMTP_PASSWORD')
-        
-        if not all([smtp_username, smtp_password]):
-            logging.warning("SMTP credentials not configured")
-            return
-        
-        msg = MIMEMultipart()
-        msg['From'] = smtp_username
-        msg['To'] = to_email
-        msg['Subject'] = subject
-        
-        msg.attach(MIMEText(body, 'html'))
-        
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()
-        server.login(smtp_username, smtp_password)
-        text = msg.as_string()
-        server.sendmail(smtp_username, to_email, text)
-        server.quit()
-        
-        logging.info(f"Email sent to {to_email}")
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _smtp_send_blocking, to_email, subject, body)
     except Exception as e:
         logging.error(f"Failed to send email: {str(e)}")
 
+# Cursor helpers for range-based pagination, sorted (created_at desc, id asc).
+# The id tie-break keeps documents sharing a created_at from being skipped.
+_PAGE_SORT = [("created_at", -1), ("id", 1)]
+
+def _encode_cursor(created_at: datetime, doc_id: str) -> str:
+    return base64.b64encode(f"{created_at.isoformat()}|{doc_id}".encode()).decode()
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Turn an opaque cursor into the filter selecting everything after it"""
+    if not cursor:
+        return None
+    try:
+        raw_created_at, sep, doc_id = base64.b64decode(cursor).decode().partition('|')
+        if not sep or not doc_id:
+            raise ValueError("missing tie-break id")
+        created_at = datetime.fromisoformat(raw_created_at)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "id": {"$gt": doc_id}}
+    ]}
+
 # API Routes
 
 # Developer Management
@@ -194,23 +385,28 @@ async def create_developer(developer: DeveloperCreate, x_user_hash: Optional[str
     await user_collections['developers'].insert_one(developer_obj.dict())
     return developer_obj
 
-@api_router.get("/developers", response_model=List[Developer])
-async def get_developers(x_user_hash: Optional[str] = Header(None)):
+@api_router.get("/developers")
+async def get_developers(limit: int = Query(50, ge=1, le=200), cursor: Optional[str] = None,
+                         x_user_hash: Optional[str] = Header(None)):
     user_collections = get_user_db(x_user_hash)
-    developers = await user_collections['developers'].find().to_list(1000)
-    return [Developer(**dev) for dev in developers]
+    query = _decode_cursor(cursor) or {}
+
+    db_cursor = user_collections['developers'].find(query, projection={"_id": 0}) \
+        .sort(_PAGE_SORT).limit(limit).batch_size(200)
+    items = [Developer.model_construct(**dev) async for dev in db_cursor]
+    next_cursor = _encode_cursor(items[-1].created_at, items[-1].id) if len(items) == limit else None
+    return {"items": items, "next_cursor": next_cursor}
 
 @api_router.get("/developers/{developer_id}", response_model=Developer)
 async def get_developer(developer_id: str, x_user_hash: Optional[str] = Header(None)):
     user_collections = get_user_db(x_user_hash)
-    developer = await user_collections['developers'].find_one({"id": developer_id})
+    developer = await user_collections['developers'].find_one({"id": developer_id}, projection={"_id": 0})
     if not developer:
         raise HTTPException(status_code=404, detail="Developer not found")
     return Developer(**developer)
 
 # Service Management
 @api_router.post("/services", response_model=Service)
-@api_router.post("/services", response_model=Service)
 async def create_service(service_data: ServiceCreate, background_tasks: BackgroundTasks, x_user_hash: Optional[str] = Header(None)):
     user_collections = get_user_db(x_user_hash)
 
@@ -223,30 +419,42 @@ async def create_service(service_data: ServiceCreate, background_tasks: Backgrou
     # Save service in DB
     await user_collections["services"].insert_one(service_obj.dict())
 
-    # Create pipeline
+    # Create pipeline and point the service at it
     pipeline = Pipeline(service_id=service_obj.id)
     await user_collections["pipelines"].insert_one(pipeline.dict())
+    await user_collections["services"].update_one(
+        {"id": service_obj.id},
+        {"$set": {"current_pipeline_id": pipeline.id}}
+    )
 
-    # Start async creation
-    background_tasks.add_task(process_service_creation, service_obj.id, x_user_hash)
+    # Start async creation: prefer the arq worker so the long-running
+    # GitHub/pipeline work doesn't share the HTTP worker's event loop
+    if app.state.arq:
+        await app.state.arq.enqueue_job("process_service_creation_job", service_obj.id, x_user_hash)
+    else:
+        background_tasks.add_task(process_service_creation, service_obj.id, x_user_hash)
 
     return service_obj
 
 
-@api_router.get("/services", response_model=List[Service])
-async def get_services(developer_id: Optional[str] = None, x_user_hash: Optional[str] = Header(None)):
+@api_router.get("/services")
+async def get_services(developer_id: Optional[str] = None, limit: int = Query(50, ge=1, le=200),
+                       cursor: Optional[str] = None, x_user_hash: Optional[str] = Header(None)):
     user_collections = get_user_db(x_user_hash)
-    query = {}
+    query = _decode_cursor(cursor) or {}
     if developer_id:
         query["developer_id"] = developer_id
-    
-    services = await user_collections['services'].find(query).to_list(1000)
-    return [Service(**service) for service in services]
+
+    db_cursor = user_collections['services'].find(query, projection={"_id": 0}) \
+        .sort(_PAGE_SORT).limit(limit).batch_size(200)
+    items = [Service.model_construct(**service) async for service in db_cursor]
+    next_cursor = _encode_cursor(items[-1].created_at, items[-1].id) if len(items) == limit else None
+    return {"items": items, "next_cursor": next_cursor}
 
 @api_router.get("/services/{service_id}", response_model=Service)
 async def get_service(service_id: str, x_user_hash: Optional[str] = Header(None)):
     user_collections = get_user_db(x_user_hash)
-    service = await user_collections['services'].find_one({"id": service_id})
+    service = await user_collections['services'].find_one({"id": service_id}, projection={"_id": 0})
     if not service:
         raise HTTPException(status_code=404, detail="Service not found")
     return Service(**service)
@@ -264,10 +472,24 @@ async def delete_service(service_id: str, x_user_hash: Optional[str] = Header(No
     return {"message": "Service deleted successfully"}
 
 # Pipeline Management
+async def _current_pipeline_filter(user_collections: dict, service_id: str) -> Dict[str, Any]:
+    """Build the filter for a service's current pipeline.
+
+    Uses the denormalized current_pipeline_id pointer (primary-key lookup);
+    falls back to the old sort-by-created_at scan for pre-pointer documents.
+    """
+    service = await user_collections['services'].find_one(
+        {"id": service_id}, projection={"_id": 0, "current_pipeline_id": 1}
+    )
+    if service and service.get("current_pipeline_id"):
+        return {"id": service["current_pipeline_id"]}
+    return {"service_id": service_id}
+
 @api_router.get("/services/{service_id}/pipeline", response_model=Pipeline)
 async def get_service_pipeline(service_id: str, x_user_hash: Optional[str] = Header(None)):
     user_collections = get_user_db(x_user_hash)
-    pipeline = await user_collections['pipelines'].find_one({"service_id": service_id}, sort=[("created_at", -1)])
+    pipeline_filter = await _current_pipeline_filter(user_collections, service_id)
+    pipeline = await user_collections['pipelines'].find_one(pipeline_filter, sort=[("created_at", -1)])
     if not pipeline:
         raise HTTPException(status_code=404, detail="Pipeline not found")
     return Pipeline(**pipeline)
@@ -275,43 +497,58 @@ async def get_service_pipeline(service_id: str, x_user_hash: Optional[str] = Hea
 @api_router.put("/services/{service_id}/pipeline")
 async def update_pipeline(service_id: str, update_data: PipelineUpdate, x_user_hash: Optional[str] = Header(None)):
     user_collections = get_user_db(x_user_hash)
-    pipeline = await user_collections['pipelines'].find_one({"service_id": service_id}, sort=[("created_at", -1)])
-    if not pipeline:
-        raise HTTPException(status_code=404, detail="Pipeline not found")
-    
+    pipeline_filter = await _current_pipeline_filter(user_collections, service_id)
+
     update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
     update_dict["updated_at"] = datetime.utcnow()
-    
-    await user_collections['pipelines'].update_one(
-        {"id": pipeline["id"]}, 
-        {"$set": update_dict}
+
+    # Single atomic find-and-modify instead of a racy read-then-update pair
+    pipeline = await user_collections['pipelines'].find_one_and_update(
+        pipeline_filter,
+        {"$set": update_dict},
+        sort=[("created_at", -1)],
+        return_document=ReturnDocument.AFTER
     )
-    
+    if not pipeline:
+        raise HTTPException(status_code=404, detail="Pipeline not found")
+
     return {"message": "Pipeline updated successfully"}
 
 @api_router.post("/services/{service_id}/rollback")
 async def rollback_service(service_id: str, x_user_hash: Optional[str] = Header(None)):
     user_collections = get_user_db(x_user_hash)
-    service = await user_collections['services'].find_one({"id": service_id})
+    service = await user_collections['services'].find_one(
+        {"id": service_id}, projection={"_id": 0, "id": 1}
+    )
     if not service:
         raise HTTPException(status_code=404, detail="Service not found")
     
-    # Create rollback pipeline
+    # Create rollback pipeline and move the service pointer to it
     pipeline = Pipeline(
         service_id=service_id,
         stage="rollback",
         status="running"
     )
     await user_collections['pipelines'].insert_one(pipeline.dict())
-    
+    await user_collections['services'].update_one(
+        {"id": service_id},
+        {"$set": {"current_pipeline_id": pipeline.id}}
+    )
+
     return {"message": "Rollback initiated", "pipeline_id": pipeline.id}
 
 # Templates
-@api_router.get("/templates", response_model=List[ServiceTemplate])
-async def get_templates(x_user_hash: Optional[str] = Header(None)):
+@api_router.get("/templates")
+async def get_templates(limit: int = Query(50, ge=1, le=200), cursor: Optional[str] = None,
+                        x_user_hash: Optional[str] = Header(None)):
     user_collections = get_user_db(x_user_hash)
-    templates = await user_collections['templates'].find().to_list(1000)
-    return [ServiceTemplate(**template) for template in templates]
+    query = _decode_cursor(cursor) or {}
+
+    db_cursor = user_collections['templates'].find(query, projection={"_id": 0}) \
+        .sort(_PAGE_SORT).limit(limit).batch_size(200)
+    items = [ServiceTemplate.model_construct(**template) async for template in db_cursor]
+    next_cursor = _encode_cursor(items[-1].created_at, items[-1].id) if len(items) == limit else None
+    return {"items": items, "next_cursor": next_cursor}
 
 @api_router.get("/templates/{service_type}", response_model=ServiceTemplate)
 async def get_template(service_type: str, x_user_hash: Optional[str] = Header(None)):
@@ -323,7 +560,7 @@ async def get_template(service_type: str, x_user_hash: Optional[str] = Header(No
 
 # Webhooks (for CI/CD integration)
 @api_router.post("/webhooks/jenkins")
-async def jenkins_webhook(webhook_data: Dict[str, Any]):
+async def jenkins_webhook(webhook_data: Dict[str, Any], background_tasks: BackgroundTasks):
     """Handle Jenkins webhook notifications"""
     service_id = webhook_data.get('service_id')
     status = webhook_data.get('status', '').lower()
@@ -333,50 +570,62 @@ async def jenkins_webhook(webhook_data: Dict[str, Any]):
     if not service_id:
         raise HTTPException(status_code=400, detail="Missing service_id")
     
+    now = datetime.utcnow()
+
     # Update service status
     update_data = {
         "status": "running" if status == "success" else "failed",
-        "updated_at": datetime.utcnow()
+        "updated_at": now
     }
     
     if service_url:
         update_data["service_url"] = service_url
     
-    await db.services.update_one(
+    # Read the service first: the pipeline update must target the
+    # current_pipeline_id pointer, or a post-rollback service could have an
+    # old pipeline marked success/failed while the current one stays running
+    service = await db.services.find_one(
         {"id": service_id},
-        {"$set": update_data}
+        projection={"_id": 0, "name": 1, "developer_id": 1, "current_pipeline_id": 1}
     )
-    
-    # Update pipeline
+    if service and service.get("current_pipeline_id"):
+        pipeline_filter = {"id": service["current_pipeline_id"]}
+    else:
+        pipeline_filter = {"service_id": service_id}
+
     pipeline_status = "success" if status == "success" else "failed"
-    await db.pipelines.update_one(
-        {"service_id": service_id},
-        {"$set": {
-            "status": pipeline_status,
-            "progress": 100,
-            "updated_at": datetime.utcnow()
-        }},
-        sort=[("created_at", -1)]
+    await asyncio.gather(
+        db.services.update_one(
+            {"id": service_id},
+            {"$set": update_data}
+        ),
+        db.pipelines.update_one(
+            pipeline_filter,
+            {"$set": {
+                "status": pipeline_status,
+                "progress": 100,
+                "updated_at": now
+            }}
+        )
     )
-    
-    # Send notification email
-    service = await db.services.find_one({"id": service_id})
     if service:
-        developer = await db.developers.find_one({"id": service["developer_id"]})
+        developer = await db.developers.find_one(
+            {"id": service["developer_id"]}, projection={"_id": 0, "email": 1}
+        )
         if developer:
             subject = f"Velora: {service['name']} Deployment {status.title()}"
-            body = f"""
-            <h2>Deployment Notification</h2>
-            <p><strong>Service:</strong> {service['name']}</p>
-            <p><strong>Status:</strong> {status.title()}</p>
-            <p><strong>Build Number:</strong> {build_number}</p>
-            {f'<p><strong>Service URL:</strong> <a href="{service_url}">{service_url}</a></p>' if service_url else ''}
-            <p><strong>Timestamp:</strong> {datetime.utcnow().isoformat()}</p>
-            
-            <p>Visit your <a href="{os.getenv('FRONTEND_URL', 'http://localhost:3005')}">Velora Dashboard</a> for more details.</p>
-            """
-            
-            await send_email_notification(developer['email'], subject, body)
+            body = DEPLOYMENT_EMAIL_TEMPLATE.render(
+                service_name=service['name'],
+                status=status.title(),
+                build_number=build_number,
+                service_url=service_url,
+                timestamp=now.isoformat(),
+                frontend_url=os.getenv('FRONTEND_URL', 'http://localhost:3005')
+            )
+
+
+            # Deliver the email after the response; SMTP must not block the webhook
+            background_tasks.add_task(send_email_notification, developer['email'], subject, body)
     
     return {"message": "Webhook processed successfully"}
 
@@ -388,37 +637,26 @@ async def get_dashboard_analytics(x_user_hash: Optional[str] = Header(None)):
     """Get dashboard analytics data for the current user (Multi-tenant)"""
     user_collections = get_user_db(x_user_hash)
 
-    # Total Services Count
-    service_count_result = await user_collections['services'].aggregate([
-        {"$group": {"_id": None, "count": {"$sum": 1}}}
-    ]).to_list(1)
-    total_services = service_count_result[0]['count'] if service_count_result else 0
-
-    # Total Developers Count
-    developer_count_result = await user_collections['developers'].aggregate([
-        {"$group": {"_id": None, "count": {"$sum": 1}}}
+    # One $facet pipeline answers counts, group-bys and recent services in a single round-trip
+    facet_result = await user_collections['services'].aggregate([
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "by_status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+            "by_type": [{"$group": {"_id": "$service_type", "count": {"$sum": 1}}}],
+            "recent": [{"$sort": {"created_at": -1}}, {"$limit": 10}]
+        }}
     ]).to_list(1)
-    total_developers = developer_count_result[0]['count'] if developer_count_result else 0
-
-    # Services by status
-    services_by_status = await user_collections['services'].aggregate([
-        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
-    ]).to_list(10)
+    facets = facet_result[0] if facet_result else {}
 
-    # Services by type
-    services_by_type = await user_collections['services'].aggregate([
-        {"$group": {"_id": "$service_type", "count": {"$sum": 1}}}
-    ]).to_list(10)
-
-    # Recent activities (last 10 services)
-    recent_services = await user_collections['services'].find().sort("created_at", -1).limit(10).to_list(10)
+    total_services = facets.get('total', [{}])[0].get('n', 0) if facets.get('total') else 0
+    total_developers = await user_collections['developers'].count_documents({})
 
     return {
         "total_services": total_services,
         "total_developers": total_developers,
-        "services_by_status": {item["_id"]: item["count"] for item in services_by_status},
-        "services_by_type": {item["_id"]: item["count"] for item in services_by_type},
-        "recent_activities": [Service(**service) for service in recent_services]
+        "services_by_status": {item["_id"]: item["count"] for item in facets.get('by_status', [])},
+        "services_by_type": {item["_id"]: item["count"] for item in facets.get('by_type', [])},
+        "recent_activities": [Service.model_construct(**{k: v for k, v in service.items() if k != "_id"}) for service in facets.get('recent', [])]
     }
 
 async def process_service_creation(service_id: str, user_hash: str = None):
@@ -429,9 +667,19 @@ async def process_service_creation(service_id: str, user_hash: str = None):
             'pipelines': db.pipelines
         }
 
+        service = await user_collections['services'].find_one({"id": service_id})
+        if not service:
+            return
+
+        # Address the current pipeline by primary key via the denormalized pointer
+        if service.get("current_pipeline_id"):
+            pipeline_filter = {"id": service["current_pipeline_id"]}
+        else:
+            pipeline_filter = {"service_id": service_id}
+
         # Update pipeline to running
         await user_collections['pipelines'].update_one(
-            {"service_id": service_id},
+            pipeline_filter,
             {"$set": {
                 "status": "running",
                 "stage": "github_repo_creation",
@@ -440,10 +688,6 @@ async def process_service_creation(service_id: str, user_hash: str = None):
             }}
         )
 
-        service = await user_collections['services'].find_one({"id": service_id})
-        if not service:
-            return
-
         # Get GitHub token
         github_token = os.getenv('GITHUB_TOKEN')
 
@@ -462,24 +706,27 @@ async def process_service_creation(service_id: str, user_hash: str = None):
                     github_token
                 )
 
-                # Update GitHub URL
-                await user_collections['services'].update_one(
-                    {"id": service_id},
-                    {"$set": {
-                        "github_repo_url": repo_data.get("clone_url"),
-                        "updated_at": datetime.utcnow()
-                    }}
-                )
-
-                # Pipeline update
-                await user_collections['pipelines'].update_one(
-                    {"service_id": service_id},
-                    {"$set": {
-                        "stage": "template_generation",
-                        "progress": 30,
-                        "logs": ["✅ GitHub repository created successfully"],
-                        "updated_at": datetime.utcnow()
-                    }}
+                # Update GitHub URL and pipeline stage concurrently
+                now = datetime.utcnow()
+                await asyncio.gather(
+                    user_collections['services'].update_one(
+                        {"id": service_id},
+                        {"$set": {
+                            "github_repo_url": repo_data.get("clone_url"),
+                            "updated_at": now
+                        }}
+                    ),
+                    user_collections['pipelines'].update_one(
+                        pipeline_filter,
+                        {
+                            "$set": {
+                                "stage": "template_generation",
+                                "progress": 30,
+                                "updated_at": now
+                            },
+                            "$push": {"logs": {"$each": ["✅ GitHub repository created successfully"]}}
+                        }
+                    )
                 )
 
                 # Apply template files
@@ -495,13 +742,15 @@ async def process_service_creation(service_id: str, user_hash: str = None):
                     )
 
                     await user_collections['pipelines'].update_one(
-                        {"service_id": service_id},
-                        {"$set": {
-                            "stage": "ci_cd_setup",
-                            "progress": 60,
-                            "logs": ["✅ Template files pushed to repository"],
-                            "updated_at": datetime.utcnow()
-                        }}
+                        pipeline_filter,
+                        {
+                            "$set": {
+                                "stage": "ci_cd_setup",
+                                "progress": 60,
+                                "updated_at": datetime.utcnow()
+                            },
+                            "$push": {"logs": {"$each": ["✅ Template files pushed to repository"]}}
+                        }
                     )
 
             except Exception as github_error:
@@ -513,29 +762,33 @@ async def process_service_creation(service_id: str, user_hash: str = None):
         # DO NOT overwrite docker_image if CLI provided it
         # -----------------------------------------------
 
-        await user_collections['services'].update_one(
-            {"id": service_id},
-            {"$set": {
-                "docker_image": existing_docker_image,   # keep real image
-                "status": "running",
-                "service_url": service.get(
-                    'service_url',
-                    f"https://{service['name']}.velora.dev"
-                ),
-                "updated_at": datetime.utcnow()
-            }}
-        )
-
-        # Mark pipeline completed
-        await user_collections['pipelines'].update_one(
-            {"service_id": service_id},
-            {"$set": {
-                "status": "success",
-                "stage": "completed",
-                "progress": 100,
-                "logs": ["Service deployment completed successfully"],
-                "updated_at": datetime.utcnow()
-            }}
+        # Final service status and pipeline completion are independent writes
+        now = datetime.utcnow()
+        await asyncio.gather(
+            user_collections['services'].update_one(
+                {"id": service_id},
+                {"$set": {
+                    "docker_image": existing_docker_image,   # keep real image
+                    "status": "running",
+                    "service_url": service.get(
+                        'service_url',
+                        f"https://{service['name']}.velora.dev"
+                    ),
+                    "updated_at": now
+                }}
+            ),
+            user_collections['pipelines'].update_one(
+                pipeline_filter,
+                {
+                    "$set": {
+                        "status": "success",
+                        "stage": "completed",
+                        "progress": 100,
+                        "updated_at": now
+                    },
+                    "$push": {"logs": {"$each": ["Service deployment completed successfully"]}}
+                }
+            )
         )
 
     except Exception as e:
@@ -544,18 +797,22 @@ async def process_service_creation(service_id: str, user_hash: str = None):
             'pipelines': db.pipelines
         }
 
-        await user_collections['services'].update_one(
-            {"id": service_id},
-            {"$set": {"status": "failed", "updated_at": datetime.utcnow()}}
-        )
-
-        await user_collections['pipelines'].update_one(
-            {"service_id": service_id},
-            {"$set": {
-                "status": "failed",
-                "logs": [f"Error: {str(e)}"],
-                "updated_at": datetime.utcnow()
-            }}
+        now = datetime.utcnow()
+        await asyncio.gather(
+            user_collections['services'].update_one(
+                {"id": service_id},
+                {"$set": {"status": "failed", "updated_at": now}}
+            ),
+            user_collections['pipelines'].update_one(
+                {"service_id": service_id},
+                {
+                    "$set": {
+                        "status": "failed",
+                        "updated_at": now
+                    },
+                    "$push": {"logs": {"$each": [f"Error: {str(e)}"]}}
+                }
+            )
         )
 
         logging.error(f"Service creation failed for {service_id}: {str(e)}")
@@ -563,6 +820,10 @@ async def process_service_creation(service_id: str, user_hash: str = None):
 # CLOUDWATCH & ADMIN DASHBOARD ENDPOINTS
 # ==========================================
 
+# Read once at import; compared with hmac to avoid the short-circuiting
+# (timing-leaky) string equality
+_ADMIN_PW = os.getenv('ADMIN_PASSWORD', 'velora-cli-engine').encode()
+
 class AdminAuthRequest(BaseModel):
     password: str
 
@@ -573,9 +834,7 @@ class CloudWatchMetricsRequest(BaseModel):
 @api_router.post("/admin/authenticate")
 async def admin_authenticate(auth_request: AdminAuthRequest):
     """Authenticate admin user with password"""
-    admin_password = os.getenv('ADMIN_PASSWORD', 'velora-cli-engine')
-    
-    if auth_request.password == admin_password:
+    if hmac.compare_digest(auth_request.password.encode(), _ADMIN_PW):
         return {
             "authenticated": True,
             "message": "Authentication successful"
@@ -583,22 +842,56 @@ async def admin_authenticate(auth_request: AdminAuthRequest):
     else:
         raise HTTPException(status_code=401, detail="Invalid password")
 
+_TIME_RANGES = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30)
+}
+
 # Helper function to get time range
 def get_time_range(time_range_str: str):
     """Convert time range string to datetime objects"""
     now = datetime.utcnow()
-    
-    time_ranges = {
-        "1h": timedelta(hours=1),
-        "24h": timedelta(hours=24),
-        "7d": timedelta(days=7),
-        "30d": timedelta(days=30)
-    }
-    
-    delta = time_ranges.get(time_range_str, timedelta(hours=1))
-    start_time = now - delta
-    
-    return start_time, now
+    delta = _TIME_RANGES.get(time_range_str, _TIME_RANGES["1h"])
+
+    return now - delta, now
+
+# Bounded pool for sync boto3 calls so they don't block the event loop
+_aws_pool = ThreadPoolExecutor(max_workers=8)
+
+async def _run_aws(fn, /, **kwargs):
+    """Run a sync boto3 call on the AWS thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_aws_pool, functools.partial(fn, **kwargs))
+
+# Short TTL cache for slow-changing AWS control-plane lookups
+_aws_cache: Dict[str, Any] = {}
+
+async def _cached_aws_call(key: str, ttl: int, fn, /, **kwargs):
+    """Serve an AWS read from cache while its TTL holds, else refresh it"""
+    now = time.monotonic()
+    cached = _aws_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    value = await _run_aws(fn, **kwargs)
+    _aws_cache[key] = (now + ttl, value)
+    return value
+
+@functools.lru_cache(maxsize=1)
+def _build_aws_clients(aws_region: str, aws_access_key: str, aws_secret_key: str):
+    """Construct the boto3 session and clients once per credential set"""
+    session = boto3.Session(
+        aws_access_key_id=aws_access_key,
+        aws_secret_access_key=aws_secret_key,
+        region_name=aws_region
+    )
+
+    cloudwatch = session.client('cloudwatch')
+    eks = session.client('eks')
+    ec2 = session.client('ec2')
+
+    return cloudwatch, eks, ec2
 
 # Helper function to initialize AWS clients
 def get_aws_clients():
@@ -607,46 +900,59 @@ def get_aws_clients():
         aws_region = os.getenv('AWS_REGION', 'ap-south-1')
         aws_access_key = os.getenv('AWS_ACCESS_KEY_ID')
         aws_secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
-        
+
         if not aws_access_key or not aws_secret_key:
             raise HTTPException(
-                status_code=500, 
+                status_code=500,
                 detail="AWS credentials not configured. Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY in .env file"
             )
-        
-        session = boto3.Session(
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key,
-            region_name=aws_region
-        )
-        
-        cloudwatch = session.client('cloudwatch')
-        eks = session.client('eks')
-        ec2 = session.client('ec2')
-        
+
+        cloudwatch, eks, ec2 = _build_aws_clients(aws_region, aws_access_key, aws_secret_key)
+
         return cloudwatch, eks, ec2, aws_region
     except Exception as e:
         logging.error(f"Failed to initialize AWS clients: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to initialize AWS clients: {str(e)}")
 
+# Response cache for the admin dashboard endpoints. Dashboards poll every few
+# seconds; a short TTL keeps them off AWS, and a stale copy is served if a
+# refresh fails mid-poll.
+_response_cache: Dict[Any, Any] = {}
+
+async def _cached_admin_response(cache_key, ttl: int, fresh: bool, fetch, *args):
+    """Serve fetch() from the response cache, refreshing after ttl seconds"""
+    if not fresh:
+        entry = _response_cache.get(cache_key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+    try:
+        payload = await fetch(*args)
+    except (HTTPException, ClientError, BotoCoreError):
+        # Refresh failed; fall back to the last known value if there is one
+        entry = _response_cache.get(cache_key)
+        if entry:
+            return {**entry[1], "stale": True}
+        raise
+
+    _response_cache[cache_key] = (time.monotonic() + ttl, payload)
+    return payload
+
 # Get CloudWatch metrics for EKS cluster
 @api_router.post("/admin/cloudwatch/metrics")
-async def get_cloudwatch_metrics(metrics_request: CloudWatchMetricsRequest):
+async def get_cloudwatch_metrics(metrics_request: CloudWatchMetricsRequest, fresh: bool = False):
     """Get CloudWatch metrics for EKS cluster"""
+    return await _cached_admin_response(
+        ("cw", metrics_request.time_range), 30, fresh, _fetch_cloudwatch_metrics, metrics_request
+    )
+
+async def _fetch_cloudwatch_metrics(metrics_request: CloudWatchMetricsRequest):
     try:
         cloudwatch, eks, ec2, aws_region = get_aws_clients()
         cluster_name = os.getenv('EKS_CLUSTER_NAME', 'arnav-velora2')
         
         start_time, end_time = get_time_range(metrics_request.time_range)
         
-        # Get cluster info
-        try:
-            cluster_info = eks.describe_cluster(name=cluster_name)
-            cluster_status = cluster_info['cluster']['status']
-        except ClientError as e:
-            logging.error(f"Failed to get cluster info: {str(e)}")
-            cluster_status = "Unknown"
-        
         # Get metrics from CloudWatch
         metrics_data = {}
         
@@ -690,49 +996,83 @@ async def get_cloudwatch_metrics(metrics_request: CloudWatchMetricsRequest):
             }
         ]
         
-        # Fetch each metric
-        for query in metric_queries:
-            try:
-                response = cloudwatch.get_metric_statistics(
-                    Namespace=query["namespace"],
-                    MetricName=query["metric_name"],
-                    Dimensions=[
-                        {
-                            'Name': 'ClusterName',
-                            'Value': cluster_name
-                        }
-                    ],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=300,  # 5 minutes
-                    Statistics=[query["stat"]]
-                )
-                
-                datapoints = sorted(response['Datapoints'], key=lambda x: x['Timestamp'])
-                
+        # Fetch all metrics in one GetMetricData batch call (1 RTT instead of 6)
+        data_queries = [
+            {
+                "Id": f"m{i}",
+                "MetricStat": {
+                    "Metric": {
+                        "Namespace": query["namespace"],
+                        "MetricName": query["metric_name"],
+                        "Dimensions": [
+                            {
+                                'Name': 'ClusterName',
+                                'Value': cluster_name
+                            }
+                        ]
+                    },
+                    "Period": 300,  # 5 minutes
+                    "Stat": query["stat"]
+                },
+                "ReturnData": True
+            }
+            for i, query in enumerate(metric_queries)
+        ]
+
+        # Cluster describe and metric fetch are independent; overlap them on the
+        # AWS thread pool so the endpoint pays max-of-calls instead of sum
+        cluster_info, response = await asyncio.gather(
+            _cached_aws_call(f"describe_cluster:{cluster_name}", 60,
+                             eks.describe_cluster, name=cluster_name),
+            _run_aws(
+                cloudwatch.get_metric_data,
+                MetricDataQueries=data_queries,
+                StartTime=start_time,
+                EndTime=end_time,
+                ScanBy='TimestampAscending'
+            ),
+            return_exceptions=True
+        )
+
+        if isinstance(cluster_info, Exception):
+            logging.error(f"Failed to get cluster info: {str(cluster_info)}")
+            cluster_status = "Unknown"
+        else:
+            cluster_status = cluster_info['cluster']['status']
+
+        if isinstance(response, Exception):
+            raise response
+
+        results_by_id = {result['Id']: result for result in response.get('MetricDataResults', [])}
+        for i, query in enumerate(metric_queries):
+            result = results_by_id.get(f"m{i}")
+            if result and result.get('StatusCode') in ('Complete', 'PartialData'):
+                # ScanBy already returns the parallel arrays time-ordered
                 metrics_data[query["name"]] = {
-                    "timestamps": [dp['Timestamp'].isoformat() for dp in datapoints],
-                    "values": [dp.get(query["stat"], 0) for dp in datapoints],
-                    "unit": datapoints[0].get('Unit', 'None') if datapoints else 'None'
+                    "timestamps": [ts.isoformat() for ts in result.get('Timestamps', [])],
+                    "values": list(result.get('Values', [])),
+                    "unit": "None"
                 }
-            except ClientError as e:
-                logging.warning(f"Failed to fetch metric {query['name']}: {str(e)}")
+            else:
+                messages = "; ".join(m.get('Value', '') for m in (result or {}).get('Messages', []))
+                logging.warning(f"Failed to fetch metric {query['name']}: {messages or 'no data returned'}")
                 metrics_data[query["name"]] = {
                     "timestamps": [],
                     "values": [],
                     "unit": "None",
-                    "error": str(e)
+                    "error": messages or "no data returned"
                 }
         
         # Calculate current average values
         current_metrics = {}
         for metric_name, metric_data in metrics_data.items():
-            if metric_data["values"]:
+            arr = np.asarray(metric_data["values"], dtype=np.float32)
+            if arr.size:
                 current_metrics[metric_name] = {
-                    "current": metric_data["values"][-1] if metric_data["values"] else 0,
-                    "average": sum(metric_data["values"]) / len(metric_data["values"]) if metric_data["values"] else 0,
-                    "max": max(metric_data["values"]) if metric_data["values"] else 0,
-                    "min": min(metric_data["values"]) if metric_data["values"] else 0
+                    "current": float(arr[-1]),
+                    "average": float(arr.mean()),
+                    "max": float(arr.max()),
+                    "min": float(arr.min())
                 }
             else:
                 current_metrics[metric_name] = {
@@ -758,36 +1098,90 @@ async def get_cloudwatch_metrics(metrics_request: CloudWatchMetricsRequest):
         logging.error(f"Failed to fetch CloudWatch metrics: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch metrics: {str(e)}")
 
+# In-process Kubernetes API client, built lazily so the server still runs
+# without the kubernetes package or cluster credentials
+_k8s_api = None
+
+def _get_k8s_api():
+    """Build (once) a CoreV1Api client from in-cluster or kubeconfig credentials"""
+    global _k8s_api
+    if _k8s_api is None:
+        from kubernetes import client as k8s_client, config as k8s_config
+        try:
+            k8s_config.load_incluster_config()
+        except k8s_config.ConfigException:
+            k8s_config.load_kube_config()
+        _k8s_api = k8s_client.CoreV1Api()
+    return _k8s_api
+
+def _list_pods_blocking(limit: int = 500):
+    """List pods across namespaces over the persistent API connection"""
+    api = _get_k8s_api()
+    return api.list_pod_for_all_namespaces(watch=False, limit=limit).items
+
 # Get pod statistics
 @api_router.get("/admin/pods/stats")
-async def get_pod_stats():
+async def get_pod_stats(fresh: bool = False):
     """Get pod statistics for the cluster"""
+    return await _cached_admin_response("pods", 15, fresh, _fetch_pod_stats)
+
+async def _fetch_pod_stats():
     try:
-        # This would typically use kubectl or Kubernetes API
-        # For now, return mock data that can be replaced with real kubectl calls
-        import subprocess
-        
+        # Preferred path: the in-process Kubernetes client — no fork/exec, no
+        # per-request TLS handshake, and no multi-MB kubectl JSON to parse
         try:
-            # Try to get real pod data using kubectl
-            result = subprocess.run(
-                ['kubectl', 'get', 'pods', '--all-namespaces', '-o', 'json'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                pods_data = json.loads(result.stdout)
+            pods = await _run_aws(_list_pods_blocking)
+
+            total_pods = len(pods)
+            phases = Counter(pod.status.phase for pod in pods)
+            running_pods = phases.get('Running', 0)
+            pending_pods = phases.get('Pending', 0)
+            failed_pods = phases.get('Failed', 0)
+
+            pod_details = []
+            for pod in islice(pods, 20):  # Limit to first 20 pods
+                containers = pod.spec.containers or []
+                created = pod.metadata.creation_timestamp
+                pod_details.append({
+                    "name": pod.metadata.name,
+                    "namespace": pod.metadata.namespace,
+                    "status": pod.status.phase,
+                    "containers": len(containers),
+                    "node": pod.spec.node_name or 'N/A',
+                    "created": created.isoformat() if created else 'N/A'
+                })
+
+            return {
+                "total_pods": total_pods,
+                "running_pods": running_pods,
+                "pending_pods": pending_pods,
+                "failed_pods": failed_pods,
+                "pod_details": pod_details,
+                "data_source": "kubernetes-api"
+            }
+        except Exception as e:
+            logging.warning(f"Kubernetes API unavailable: {str(e)}, trying kubectl")
+
+        try:
+            # Fallback: the kubectl proxy started at app startup serves the same
+            # PodList JSON over local keep-alive HTTP, with no per-request exec
+            proxy = getattr(app.state, 'kubectl_proxy', None)
+            proxy_url = getattr(app.state, 'kubectl_proxy_url', None)
+            if proxy and proxy_url and proxy.poll() is None:
+                async with app.state.http.get(f"{proxy_url}/api/v1/pods?limit=500") as resp:
+                    resp.raise_for_status()
+                    pods_data = await resp.json()
                 pods = pods_data.get('items', [])
                 
                 total_pods = len(pods)
-                running_pods = sum(1 for pod in pods if pod['status']['phase'] == 'Running')
-                pending_pods = sum(1 for pod in pods if pod['status']['phase'] == 'Pending')
-                failed_pods = sum(1 for pod in pods if pod['status']['phase'] == 'Failed')
-                
+                phases = Counter(pod['status']['phase'] for pod in pods)
+                running_pods = phases.get('Running', 0)
+                pending_pods = phases.get('Pending', 0)
+                failed_pods = phases.get('Failed', 0)
+
                 # Get pod resource usage
                 pod_details = []
-                for pod in pods[:20]:  # Limit to first 20 pods
+                for pod in islice(pods, 20):  # Limit to first 20 pods
                     pod_name = pod['metadata']['name']
                     namespace = pod['metadata']['namespace']
                     status = pod['status']['phase']
@@ -811,10 +1205,10 @@ async def get_pod_stats():
                     "pending_pods": pending_pods,
                     "failed_pods": failed_pods,
                     "pod_details": pod_details,
-                    "data_source": "kubectl"
+                    "data_source": "kubectl-proxy"
                 }
-        except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError) as e:
-            logging.warning(f"kubectl command failed: {str(e)}, using CloudWatch data")
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+            logging.warning(f"kubectl proxy query failed: {str(e)}, using CloudWatch data")
         
         # Fallback to CloudWatch if kubectl fails
         cloudwatch, eks, ec2, aws_region = get_aws_clients()
@@ -825,7 +1219,8 @@ async def get_pod_stats():
         start_time = end_time - timedelta(minutes=5)
         
         try:
-            response = cloudwatch.get_metric_statistics(
+            response = await _run_aws(
+                cloudwatch.get_metric_statistics,
                 Namespace='ContainerInsights',
                 MetricName='pod_number_of_containers',
                 Dimensions=[
@@ -841,6 +1236,7 @@ async def get_pod_stats():
             )
             
             datapoints = response.get('Datapoints', [])
+            datapoints.sort(key=itemgetter('Timestamp'))
             total_pods = int(datapoints[-1]['Sum']) if datapoints else 0
             
             return {
@@ -870,31 +1266,39 @@ async def get_pod_stats():
 
 # Get cost estimate
 @api_router.get("/admin/cost/estimate")
-async def get_cost_estimate():
+async def get_cost_estimate(fresh: bool = False):
     """Get estimated cost for the cluster"""
+    return await _cached_admin_response("cost", 300, fresh, _fetch_cost_estimate)
+
+async def _fetch_cost_estimate():
     try:
         cloudwatch, eks, ec2, aws_region = get_aws_clients()
         cluster_name = os.getenv('EKS_CLUSTER_NAME', 'arnav-velora2')
         
         # Get cluster nodes
         try:
-            cluster_info = eks.describe_cluster(name=cluster_name)
+            # Cluster and nodegroup-list lookups are independent; fan them out
+            cluster_info, nodegroups = await asyncio.gather(
+                _cached_aws_call(f"describe_cluster:{cluster_name}", 60,
+                                 eks.describe_cluster, name=cluster_name),
+                _cached_aws_call(f"list_nodegroups:{cluster_name}", 300,
+                                 eks.list_nodegroups, clusterName=cluster_name)
+            )
             vpc_id = cluster_info['cluster']['resourcesVpcConfig']['vpcId']
-            
-            # Get node group info
-            nodegroups = eks.list_nodegroups(clusterName=cluster_name)
-            
+
             total_cost_per_hour = 0.10  # EKS control plane cost
             total_cost_per_month = 73  # EKS control plane cost
-            
+
             node_costs = []
-            
-            for ng_name in nodegroups.get('nodegroups', []):
-                ng_info = eks.describe_nodegroup(
-                    clusterName=cluster_name,
-                    nodegroupName=ng_name
-                )
-                
+
+            # One describe_nodegroup per nodegroup, all in flight at once
+            ng_infos = await asyncio.gather(*[
+                _cached_aws_call(f"describe_nodegroup:{cluster_name}:{ng_name}", 300,
+                                 eks.describe_nodegroup, clusterName=cluster_name, nodegroupName=ng_name)
+                for ng_name in nodegroups.get('nodegroups', [])
+            ])
+
+            for ng_name, ng_info in zip(nodegroups.get('nodegroups', []), ng_infos):
                 nodegroup = ng_info['nodegroup']
                 instance_types = nodegroup.get('instanceTypes', ['t3.medium'])
                 desired_size = nodegroup.get('scalingConfig', {}).get('desiredSize', 2)
@@ -980,6 +1384,8 @@ async def health_check():
 # Include the router in the main app
 app.include_router(api_router)
 
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],       # or put your frontend URL
@@ -1001,9 +1407,77 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_task_queue():
+    """Connect to the arq queue when Redis is configured"""
+    app.state.arq = None
+    redis_url = os.getenv('REDIS_URL')
+    if redis_url and create_pool:
+        try:
+            app.state.arq = await create_pool(RedisSettings.from_dsn(redis_url))
+            logging.info("Service creation jobs routed to arq worker")
+        except Exception as e:
+            logging.warning(f"arq unavailable, falling back to BackgroundTasks: {str(e)}")
+
+@app.on_event("shutdown")
+async def shutdown_task_queue():
+    if app.state.arq:
+        await app.state.arq.close()
+
+def _build_http_session() -> aiohttp.ClientSession:
+    """Pooled session for outbound API calls; also used by the arq worker,
+    where FastAPI startup hooks never run"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, ssl=True),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+
+@app.on_event("startup")
+async def startup_http_client():
+    """Create one pooled HTTP session for all outbound API calls"""
+    app.state.http = _build_http_session()
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    await app.state.http.close()
+
+@app.on_event("startup")
+async def startup_kubectl_proxy():
+    """Start a long-lived kubectl proxy for the pod-stats fallback path"""
+    # One proxy at startup replaces a fork/exec + TLS handshake per request;
+    # pod queries then ride the pooled session over local keep-alive HTTP
+    port = os.getenv('KUBECTL_PROXY_PORT', '8001')
+    app.state.kubectl_proxy = None
+    app.state.kubectl_proxy_url = None
+    try:
+        app.state.kubectl_proxy = subprocess.Popen(
+            ['kubectl', 'proxy', f'--port={port}'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        app.state.kubectl_proxy_url = f"http://127.0.0.1:{port}"
+    except FileNotFoundError:
+        logging.warning("kubectl not found, proxy fallback disabled")
+
+@app.on_event("shutdown")
+async def shutdown_kubectl_proxy():
+    proxy = getattr(app.state, 'kubectl_proxy', None)
+    if proxy:
+        proxy.terminate()
+        proxy.wait(timeout=5)
+
 @app.on_event("startup")
 async def startup_db_client():
     """Initialize database collections and default data"""
+    # Establish the connection pool before the first request pays for it
+    await main_db.command("ping")
+
+    # Pull data out of pre-consolidation per-tenant collections before the
+    # unique indexes go in
+    await _migrate_legacy_tenant_collections()
+
+    await _ensure_indexes()
+
     # Create default templates
     api_template = {
         "name": "FastAPI Service Template",
@@ -1054,6 +1528,8 @@ CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8002"]
         "created_at": datetime.utcnow()
     }
     
+    await db.templates.create_index("service_type")
+
     # Check if template already exists
     existing_template = await db.templates.find_one({"service_type": "api"})
     if not existing_template:
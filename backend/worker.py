@@ -0,0 +1,33 @@
+"""arq worker that runs service-creation jobs off the API process.
+
+Start with:  arq worker.WorkerSettings
+Requires the same .env as the API (MONGO_URL etc.) plus REDIS_URL.
+"""
+import os
+
+from arq.connections import RedisSettings
+
+from server import app, process_service_creation, _build_http_session
+
+
+async def process_service_creation_job(ctx, service_id: str, user_hash: str = None):
+    await process_service_creation(service_id, user_hash)
+
+
+async def startup(ctx):
+    # FastAPI startup hooks never run here, so give create_github_repo the
+    # pooled session it expects on app.state
+    app.state.http = _build_http_session()
+
+
+async def shutdown(ctx):
+    await app.state.http.close()
+
+
+class WorkerSettings:
+    functions = [process_service_creation_job]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(os.getenv('REDIS_URL', 'redis://localhost:6379'))
+    max_tries = 3
+    job_timeout = 300
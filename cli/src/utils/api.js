@@ -27,9 +27,19 @@ class ApiClient {
 
   async getServices(developerId = null) {
     try {
-      const params = developerId ? { developer_id: developerId } : {};
-      const response = await this.client.get('/services', { params });
-      return response.data;
+      // The endpoint is paginated ({items, next_cursor}); follow the cursor
+      // so callers still get the complete array of services
+      const services = [];
+      let cursor = null;
+      do {
+        const params = { limit: 200 };
+        if (developerId) params.developer_id = developerId;
+        if (cursor) params.cursor = cursor;
+        const response = await this.client.get('/services', { params });
+        services.push(...(response.data.items || []));
+        cursor = response.data.next_cursor;
+      } while (cursor);
+      return services;
     } catch (error) {
       throw new Error(error.response?.data?.detail || error.message);
     }
@@ -27,6 +27,28 @@ export async function apiDelete(path) {
   });
 }
 
+// Drain a paginated list endpoint ({ items, next_cursor }) into one array.
+// Takes a full URL so callers keep using their own BACKEND_URL/headers.
+export async function fetchAllItems(url, headers) {
+  const items = [];
+  let cursor = null;
+  do {
+    const query = cursor
+      ? `?limit=200&cursor=${encodeURIComponent(cursor)}`
+      : '?limit=200';
+    const response = await fetch(`${url}${query}`, { headers });
+    if (!response.ok) {
+      const error = new Error(`Request to ${url} failed with status ${response.status}`);
+      error.status = response.status;
+      throw error;
+    }
+    const data = await response.json();
+    items.push(...(data.items || []));
+    cursor = data.next_cursor;
+  } while (cursor);
+  return items;
+}
+
 export async function apiPut(path, body) {
   return fetch(`${BACKEND_URL}${path}`, {
     method: "PUT",
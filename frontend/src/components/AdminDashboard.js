@@ -34,6 +34,7 @@ import {
   Pie,
   Cell
 } from 'recharts';
+import { fetchAllItems } from '../api';
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL || 'http://localhost:8002';
 const USER_HASH = process.env.REACT_APP_USER_HASH;
 const getHeaders = () => ({
@@ -94,15 +95,15 @@ export default function AdminDashboard() {
       // Fetch all data in parallel
       const [
         analyticsRes,
-        servicesRes,
-        developersRes,
+        servicesData,
+        developersData,
         cloudWatchRes,
         podStatsRes,
         costRes,
       ] = await Promise.all([
         fetch(`${BACKEND_URL}/api/analytics/dashboard`, { headers: getHeaders() }),
-        fetch(`${BACKEND_URL}/api/services`, { headers: getHeaders() }),
-        fetch(`${BACKEND_URL}/api/developers`, { headers: getHeaders() }),
+        fetchAllItems(`${BACKEND_URL}/api/services`, getHeaders()),
+        fetchAllItems(`${BACKEND_URL}/api/developers`, getHeaders()),
         fetch(`${BACKEND_URL}/api/admin/cloudwatch/metrics`, {
           method: 'POST',
           headers: getHeaders(),
@@ -112,14 +113,8 @@ export default function AdminDashboard() {
         fetch(`${BACKEND_URL}/api/admin/cost/estimate`, { headers: getHeaders() }),
       ]);
 
-      if (analyticsRes.ok && servicesRes.ok && developersRes.ok) {
-        const [analyticsData, servicesData, developersData] = await Promise.all([
-          analyticsRes.json(),
-          servicesRes.json(),
-          developersRes.json(),
-        ]);
-
-        setAnalytics(analyticsData);
+      if (analyticsRes.ok) {
+        setAnalytics(await analyticsRes.json());
         setServices(servicesData);
         setDevelopers(developersData);
       }
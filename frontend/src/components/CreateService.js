@@ -10,6 +10,7 @@ import {
   GitBranch
 } from 'lucide-react';
 import { toast } from 'sonner';
+import { fetchAllItems } from '../api';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL || 'http://localhost:8002';
 const USER_HASH = process.env.REACT_APP_USER_HASH;
@@ -78,14 +79,8 @@ export default function CreateService() {
   // -----------------------------
   const fetchDevelopers = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/developers`, {
-        headers,
-      });
-
-      const data = await response.json();
-
-      // Prevent frontend crash
-      const safeData = Array.isArray(data) ? data : [];
+      // Paginated endpoint: drain every {items, next_cursor} page
+      const safeData = await fetchAllItems(`${BACKEND_URL}/api/developers`, headers);
 
       setDevelopers(safeData);
 
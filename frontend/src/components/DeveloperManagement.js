@@ -11,6 +11,7 @@ import {
   Trash2
 } from 'lucide-react';
 import { toast } from 'sonner';
+import { fetchAllItems } from '../api';
 
 const BACKEND_URL ='http://localhost:8002';
 const USER_HASH = process.env.REACT_APP_USER_HASH;
@@ -45,25 +46,14 @@ export default function DeveloperManagement() {
   const fetchData = async () => {
     try {
 
-      const [developersRes, servicesRes] = await Promise.all([
-        fetch(`${BACKEND_URL}/api/developers`, { headers }),
-        fetch(`${BACKEND_URL}/api/services`, { headers })
+      // Paginated endpoints: drain every {items, next_cursor} page
+      const [developersData, servicesData] = await Promise.all([
+        fetchAllItems(`${BACKEND_URL}/api/developers`, headers),
+        fetchAllItems(`${BACKEND_URL}/api/services`, headers)
       ]);
 
-      // If backend returns 400/401 → handle safely
-      if (!developersRes.ok || !servicesRes.ok) {
-        console.error("❌ API returned an error. Most likely missing/incorrect x-user-hash.");
-        setDevelopers([]);
-        setServices([]);
-        return;
-      }
-
-      const developersData = await developersRes.json();
-      const servicesData = await servicesRes.json();
-
-      // Safe fallback: ensure arrays
-      setDevelopers(Array.isArray(developersData) ? developersData : []);
-      setServices(Array.isArray(servicesData) ? servicesData : []);
+      setDevelopers(developersData);
+      setServices(servicesData);
 
     } catch (error) {
       console.error("Failed to fetch data:", error);
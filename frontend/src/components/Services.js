@@ -14,6 +14,7 @@ import {
   AlertCircle
 } from 'lucide-react';
 import { toast } from 'sonner';
+import { fetchAllItems } from '../api';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL || 'http://localhost:8002';
 const USER_HASH = process.env.REACT_APP_USER_HASH || 'CHANGE_ME_USER_HASH';
@@ -37,19 +38,15 @@ export default function Services() {
 
   const fetchServices = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/services`, {
-        headers: getHeaders(),
-      });
-
-      if (response.status === 401) {
+      // Follows next_cursor so every page of services is loaded
+      const items = await fetchAllItems(`${BACKEND_URL}/api/services`, getHeaders());
+      setServices(items);
+    } catch (error) {
+      if (error.status === 401) {
         console.error('401 from /api/services – check REACT_APP_USER_HASH');
         toast.error('Unauthorized: missing or wrong user hash');
         return;
       }
-
-      const data = await response.json();
-      setServices(data);
-    } catch (error) {
       console.error('Failed to fetch services:', error);
       toast.error('Failed to load services');
     } finally {